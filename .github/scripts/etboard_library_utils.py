@@ -11,33 +11,52 @@
 #                 - process-libraries: Process library files
 #                 - create-bundle: Create ZIP bundle
 #                 - full-process: Run full process
+#                   (실패 시 중간 결과 보존, 다음 실행에서 이어서 처리. --no-resume: 처음부터)
+#                 - serve: Serve bundle/library zips/firmware over HTTP (asyncio)
+#                 - diff: Compare two bundles (--old, --new) or a bundle against source roots
 #               example : python ./etboard_library_utils.py full-process --debug
 # ********************************************************************************
 
+import asyncio
+import hashlib
 import json
 import os
 import sys
 import zipfile
+import zlib
 import shutil
 import glob
+from functools import partial
 from pathlib import Path
 from datetime import datetime
+from email.utils import formatdate
+from urllib.parse import unquote, urlsplit
 
 # 스크립트 경로를 기준으로 프로젝트 루트 계산 (Path 사용)
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent
 
+# full-process 재개용 체크포인트 파일 이름 (추출 폴더에 저장)
+CHECKPOINT_FILE = "_checkpoint.json"
+
+# 불필요한 파일/폴더 패턴
+LIBRARY_EXCLUDE_PATTERNS = [
+    "_file_meta.json",
+    "MetaFileUpdate.py", 
+    "FileMetaManager.py",
+    "__pycache__"
+]
+
+# 번들 최종 정리 시 제거되는 메타 파일
+BUNDLE_META_FILES = ["MetaFileUpdate.py", "FileMetaManager.py", "_file_meta.json"]
+
 def process_library(lib_dir, bundle_dir, extract_dir, debug=False):
     """
     단일 라이브러리 디렉토리를 처리하는 함수
+    반환: 번들에 생성된 폴더 이름 목록 (ZIP 처리 실패 시 None)
     """
     # 불필요한 파일/폴더 패턴
-    exclude_patterns = [
-        "_file_meta.json",
-        "MetaFileUpdate.py", 
-        "FileMetaManager.py",
-        "__pycache__"
-    ]
+    exclude_patterns = LIBRARY_EXCLUDE_PATTERNS
     
     # 라이브러리 이름 추출 (Path 사용)
     lib_dir = Path(lib_dir)
@@ -48,7 +67,7 @@ def process_library(lib_dir, bundle_dir, extract_dir, debug=False):
         if pattern in lib_name:
             if debug:
                 print(f"Skipping excluded item: {lib_name}")
-            return
+            return []
     
     if debug:
         print(f"Processing library: {lib_name}")
@@ -58,8 +77,10 @@ def process_library(lib_dir, bundle_dir, extract_dir, debug=False):
     for zip_file in lib_dir.rglob("*.zip"):
         zip_files.append(zip_file)
     
+    outputs = []
     if zip_files:
         # ZIP 파일이 있는 경우
+        failed = False
         for zip_file in zip_files:
             zip_name = zip_file.stem
             if debug:
@@ -111,8 +132,13 @@ def process_library(lib_dir, bundle_dir, extract_dir, debug=False):
                             shutil.copytree(item, dest_folder / item.name, dirs_exist_ok=True)
                         else:
                             shutil.copy2(item, dest_folder / item.name)
+                outputs.append(zip_name)
             except Exception as e:
                 print(f"Error processing ZIP file {zip_file}: {e}")
+                failed = True
+        
+        if failed:
+            return None
     else:
         # ZIP 파일이 없는 경우 직접 복사
         if debug:
@@ -146,10 +172,89 @@ def process_library(lib_dir, bundle_dir, extract_dir, debug=False):
                 shutil.copytree(item, dest_folder / item.name, dirs_exist_ok=True)
             else:
                 shutil.copy2(item, dest_folder / item.name)
+        outputs.append(lib_name)
+    
+    return outputs
+
+def library_outputs(lib_dir):
+    """
+    process_library가 번들에 만들 폴더 이름 목록 (ZIP 이름 또는 라이브러리 이름)
+    """
+    lib_dir = Path(lib_dir)
+    if any(pattern in lib_dir.name for pattern in LIBRARY_EXCLUDE_PATTERNS):
+        return []
+    zip_names = [zip_file.stem for zip_file in lib_dir.rglob("*.zip")]
+    return zip_names or [lib_dir.name]
+
+def publish_atomic(tmp_file, target_file):
+    """
+    임시 파일을 최종 경로로 원자적 교체
+    임시 파일은 쓰기 핸들에서 이미 fsync 되어 있어야 함 (Windows는 읽기 핸들 fsync 불가)
+    """
+    os.replace(tmp_file, target_file)
+    
+    # 디렉토리 엔트리 동기화 (POSIX만 해당)
+    if hasattr(os, 'O_DIRECTORY'):
+        dir_fd = os.open(Path(target_file).parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+def library_fingerprint(lib_dir):
+    """
+    라이브러리 폴더 내용 지문 (상대경로/크기/수정시각 기반)
+    """
+    lib_dir = Path(lib_dir)
+    digest = hashlib.sha256()
+    for item in sorted(lib_dir.rglob("*")):
+        if item.is_file():
+            stat = item.stat()
+            digest.update(f"{item.relative_to(lib_dir).as_posix()}|{stat.st_size}|{stat.st_mtime_ns}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+def load_checkpoint(checkpoint_file):
+    """
+    처리 완료된 라이브러리 체크포인트 읽기
+    """
+    checkpoint_file = Path(checkpoint_file)
+    if not checkpoint_file.exists():
+        return {}
+    try:
+        with open(checkpoint_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable checkpoint {checkpoint_file}: {e}")
+        return {}
+
+def save_checkpoint(checkpoint_file, checkpoint):
+    """
+    체크포인트 저장 (임시 파일 기록 후 원자적 교체)
+    """
+    checkpoint_file = Path(checkpoint_file)
+    tmp_file = checkpoint_file.with_name(checkpoint_file.name + ".tmp")
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(checkpoint, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    publish_atomic(tmp_file, checkpoint_file)
 
-def process_libraries(src_base_dir, bundle_dir, extract_dir, debug=False):
+def remove_outputs(bundle_dir, outputs, debug=False):
+    """
+    번들 폴더에서 라이브러리 처리 결과 폴더 삭제
+    """
+    for name in outputs:
+        dest_folder = Path(bundle_dir) / name
+        if dest_folder.exists():
+            shutil.rmtree(dest_folder)
+            if debug:
+                print(f"Removed directory: {dest_folder}")
+
+def process_libraries(src_base_dir, bundle_dir, extract_dir, debug=False, checkpoint_file=None):
     """
     모든 라이브러리 처리를 위한 메인 함수
+    checkpoint_file 지정 시 완료된 라이브러리를 기록하고, 다음 실행에서 건너뜀
+    반환: 처리 실패한 라이브러리 이름 목록
     """
     if debug:
         print(f"Processing libraries from: {src_base_dir}")
@@ -167,14 +272,52 @@ def process_libraries(src_base_dir, bundle_dir, extract_dir, debug=False):
     if debug:
         print(f"Found {len(lib_dirs)} library directories")
     
+    checkpoint = load_checkpoint(checkpoint_file) if checkpoint_file else {}
+    failed = []
+    
     # 각 라이브러리 처리
     for lib_dir in lib_dirs:
-        process_library(lib_dir, bundle_dir, extract_dir, debug)
+        if checkpoint_file:
+            key = str(lib_dir.resolve())
+            fingerprint = library_fingerprint(lib_dir)
+            entry = checkpoint.get(key)
+            if (entry and entry["fingerprint"] == fingerprint
+                    and all((Path(bundle_dir) / name).is_dir() for name in entry["outputs"])):
+                if debug:
+                    print(f"Already processed (checkpoint): {lib_dir.name}")
+                continue
+            
+            # 이전/중단된 결과를 지우고 다시 처리 (복사는 병합만 하므로 삭제된 파일이 남음)
+            stale = set(library_outputs(lib_dir))
+            if entry:
+                stale.update(entry["outputs"])
+            remove_outputs(bundle_dir, sorted(stale), debug)
+        
+        outputs = process_library(lib_dir, bundle_dir, extract_dir, debug)
+        if outputs is None:
+            failed.append(lib_dir.name)
+            continue
+        
+        if checkpoint_file:
+            checkpoint[key] = {"fingerprint": fingerprint, "outputs": outputs}
+            save_checkpoint(checkpoint_file, checkpoint)
+    
+    # 소스에서 삭제된 라이브러리의 체크포인트/번들 결과 제거
+    if checkpoint_file:
+        current_keys = {str(lib_dir.resolve()) for lib_dir in lib_dirs}
+        removed_keys = [key for key in checkpoint
+                        if Path(key).parent == src_base_dir.resolve() and key not in current_keys]
+        for key in removed_keys:
+            if debug:
+                print(f"Library removed from source: {Path(key).name}")
+            remove_outputs(bundle_dir, checkpoint.pop(key)["outputs"], debug)
+        if removed_keys:
+            save_checkpoint(checkpoint_file, checkpoint)
     
     # 최종 정리: 불필요한 파일 제거
     bundle_dir = Path(bundle_dir)
     for item in bundle_dir.rglob("*"):
-        if item.is_file() and item.name in ["MetaFileUpdate.py", "FileMetaManager.py", "_file_meta.json"]:
+        if item.is_file() and item.name in BUNDLE_META_FILES:
             item.unlink()
             if debug:
                 print(f"Removed file: {item}")
@@ -182,38 +325,60 @@ def process_libraries(src_base_dir, bundle_dir, extract_dir, debug=False):
             shutil.rmtree(item)
             if debug:
                 print(f"Removed directory: {item}")
+    
+    return failed
 
 def create_bundle(bundle_dir, output_file, version, versions=None, debug=False):
     """
     최종 번들 ZIP 파일 생성
+    임시 파일에 먼저 기록한 뒤 원자적으로 교체하므로, 실패해도 기존 번들은 그대로 남음
     """
     if debug:
         print(f"Creating bundle ZIP: {output_file}")
     
     # 출력 디렉토리 생성
-    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-    
-    # ZIP 파일 생성
-    with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        # 라이브러리 파일 추가
-        bundle_dir = Path(bundle_dir)
-        for item in bundle_dir.rglob("*"):
-            if item.is_file():
-                arcname = os.path.join('libraries', item.relative_to(bundle_dir))
-                zipf.write(item, arcname)
-        
-        # 생성 정보 폴더와 파일 추가 (libraries와 동일한 레벨)
-        timestamp = datetime.now().strftime('%Y_%m_%d__%H_%M_%S')
-        signature_dir = f"00._created_{timestamp}"
-        signature_path = f"{signature_dir}/signature.txt"
-        
-        # 빈 signature.txt 파일 생성
-        with zipf.open(signature_path, 'w') as f:
-            f.write(b'')
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    
+    # 임시 파일 (*.zip 패턴에 걸리지 않도록 .tmp 확장자 사용)
+    tmp_file = output_file.with_name(f".{output_file.name}.tmp")
+    
+    try:
+        write_bundle_zip(bundle_dir, tmp_file)
+        publish_atomic(tmp_file, output_file)
+    except BaseException:
+        if tmp_file.exists():
+            tmp_file.unlink()
+        raise
     
     if debug:
         print(f"ZIP bundle created: {output_file}")
 
+def write_bundle_zip(bundle_dir, output_file):
+    """
+    번들 폴더 내용을 ZIP 파일로 기록 (쓰기 핸들에서 fsync까지 수행)
+    """
+    with open(output_file, 'wb') as out:
+        with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # 라이브러리 파일 추가
+            bundle_dir = Path(bundle_dir)
+            for item in bundle_dir.rglob("*"):
+                if item.is_file():
+                    arcname = os.path.join('libraries', item.relative_to(bundle_dir))
+                    zipf.write(item, arcname)
+            
+            # 생성 정보 폴더와 파일 추가 (libraries와 동일한 레벨)
+            timestamp = datetime.now().strftime('%Y_%m_%d__%H_%M_%S')
+            signature_dir = f"00._created_{timestamp}"
+            signature_path = f"{signature_dir}/signature.txt"
+            
+            # 빈 signature.txt 파일 생성
+            with zipf.open(signature_path, 'w') as f:
+                f.write(b'')
+        
+        out.flush()
+        os.fsync(out.fileno())
+
 def cleanup(bundle_dir, extract_dir, debug=False):
     """
     임시 디렉토리 정리
@@ -234,6 +399,607 @@ def cleanup(bundle_dir, extract_dir, debug=False):
         if debug:
             print(f"Removed directory: {extract_dir}")
 
+# ********************************************************************************
+# 로컬 번들 서버 (serve)
+# 실습실 PC들이 저장소 대신 교실 서버 한 대에서 번들/라이브러리/펌웨어를 받도록 함
+# - ETag/If-None-Match : 파일 내용 해시 기반, 바뀐 파일만 다시 전송
+# - Range              : 끊긴 다운로드 이어받기
+# - /index.json        : _file_meta.json 기반 목록
+# ********************************************************************************
+
+# 전송 단위 및 keep-alive 대기 시간
+SERVE_CHUNK_SIZE = 64 * 1024
+SERVE_IDLE_TIMEOUT = 30
+
+HTTP_REASONS = {
+    200: "OK",
+    206: "Partial Content",
+    304: "Not Modified",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    416: "Range Not Satisfiable",
+    500: "Internal Server Error",
+}
+
+# 경로 -> (크기, 수정시각, ETag) 캐시
+_etag_cache = {}
+
+# 이미 경고한 중복 URL (요청마다 반복 출력 방지)
+_warned_duplicates = set()
+
+def file_etag(f, file_path):
+    """
+    열린 파일의 (ETag, 크기) 계산, 크기/수정시각이 같으면 캐시 사용
+    fstat 기준이므로 파일이 교체(os.replace)되어도 이 핸들의 내용과 일치함
+    """
+    stat = os.fstat(f.fileno())
+    cached = _etag_cache.get(str(file_path))
+    if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+        return cached[2], stat.st_size
+    
+    digest = hashlib.sha256()
+    f.seek(0)
+    for chunk in iter(lambda: f.read(1024 * 1024), b''):
+        digest.update(chunk)
+    etag = f'"{digest.hexdigest()[:32]}"'
+    _etag_cache[str(file_path)] = (stat.st_size, stat.st_mtime_ns, etag)
+    return etag, stat.st_size
+
+def compute_etag(file_path):
+    """
+    파일 내용(SHA-256) 기반 ETag와 크기 계산
+    """
+    with open(file_path, 'rb') as f:
+        return file_etag(f, file_path)
+
+def load_file_meta(src_base_dir):
+    """
+    라이브러리 폴더의 _file_meta.json body 항목 읽기
+    """
+    meta_file = Path(src_base_dir) / "_file_meta.json"
+    if not meta_file.exists():
+        return {}
+    
+    # 수작업으로 편집되는 파일이므로 형식 오류 시 메타 정보 없이 진행
+    try:
+        with open(meta_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: ignoring unreadable {meta_file}: {e}")
+        return {}
+    
+    body = data[1].get("body", {}) if isinstance(data, list) and len(data) > 1 and isinstance(data[1], dict) else {}
+    if not isinstance(body, dict):
+        print(f"Warning: ignoring malformed body in {meta_file}")
+        return {}
+    return body
+
+def collect_served_files(output_file, lib_paths, firmware_path):
+    """
+    URL 경로 -> 파일 경로 매핑 생성 (요청마다 다시 만들어 새 파일 반영)
+    """
+    files = {}
+    output_file = Path(output_file)
+    if output_file.exists():
+        files[f"/{output_file.name}"] = output_file
+    
+    # 라이브러리별 ZIP (dist 폴더), 소스 폴더 이름으로 URL 구분
+    for src_base_dir in lib_paths:
+        source = Path(src_base_dir).name
+        for zip_file in sorted(Path(src_base_dir).glob("*/dist/*.zip")):
+            url = f"/libs/{source}/{zip_file.name}"
+            if url in files:
+                if url not in _warned_duplicates:
+                    print(f"Warning: duplicate URL {url}, ignoring {zip_file} (serving {files[url]})")
+                    _warned_duplicates.add(url)
+                continue
+            files[url] = zip_file
+    
+    # 펌웨어 이미지
+    firmware_path = Path(firmware_path)
+    if firmware_path.exists():
+        for bin_file in sorted(firmware_path.rglob("*.bin")):
+            rel = bin_file.relative_to(firmware_path).as_posix()
+            files[f"/firmware/{rel}"] = bin_file
+    
+    return files
+
+def build_listing(files, lib_paths):
+    """
+    /index.json 응답 본문 생성 (메타 정보 + 크기 + ETag)
+    파일 해시 계산이 포함되므로 이벤트 루프가 아닌 executor에서 호출
+    """
+    listing = {"bundle": None, "libraries": [], "firmware": []}
+    
+    for src_base_dir in lib_paths:
+        meta = load_file_meta(src_base_dir)
+        source = Path(src_base_dir).name
+        for url, path in files.items():
+            if not url.startswith(f"/libs/{source}/") or Path(src_base_dir) not in path.parents:
+                continue
+            lib_name = path.parent.parent.name
+            entry = meta.get(lib_name)
+            if not isinstance(entry, dict):
+                entry = {}
+            try:
+                etag, size = compute_etag(path)
+            except FileNotFoundError:
+                continue
+            listing["libraries"].append({
+                "name": lib_name,
+                "source": source,
+                "created_at": entry.get("created_at", ""),
+                "ignore": entry.get("ignore", False),
+                "url": url,
+                "size": size,
+                "etag": etag,
+            })
+    
+    for url, path in files.items():
+        try:
+            etag, size = compute_etag(path)
+        except FileNotFoundError:
+            continue
+        item = {"url": url, "size": size, "etag": etag}
+        if url.startswith("/firmware/"):
+            listing["firmware"].append(item)
+        elif not url.startswith("/libs/"):
+            listing["bundle"] = item
+    
+    return json.dumps(listing, ensure_ascii=False, indent=2).encode('utf-8')
+
+def parse_range(range_header, size):
+    """
+    Range 헤더 해석 (단일 bytes 범위만 지원)
+    반환: (start, end) 또는 None(전체 전송), 만족할 수 없으면 ValueError
+    """
+    unit, _, spec = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        # 다중 범위는 무시하고 전체 전송 (RFC 9110 허용)
+        return None
+    
+    first, sep, last = (part.strip() for part in spec.partition("-"))
+    if not sep or not (first or last) or not all(part.isdigit() for part in (first, last) if part):
+        # 형식이 잘못된 Range는 무시
+        return None
+    
+    if not first:
+        # 마지막 N 바이트
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError("range not satisfiable")
+        return max(size - length, 0), size - 1
+    
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError("range not satisfiable")
+    return start, min(end, size - 1)
+
+def etag_matches(header_value, etag):
+    """
+    If-None-Match 비교 (약한 비교)
+    """
+    if header_value.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in header_value.split(",")]
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+async def send_response(writer, status, headers, body=b""):
+    """
+    상태줄/헤더/본문 전송
+    """
+    lines = [f"HTTP/1.1 {status} {HTTP_REASONS[status]}"]
+    lines.append(f"Date: {formatdate(usegmt=True)}")
+    lines.extend(f"{name}: {value}" for name, value in headers.items())
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode('latin-1'))
+    if body:
+        writer.write(body)
+    await writer.drain()
+
+async def send_file(writer, f, start, length):
+    """
+    열린 파일의 구간을 청크 단위로 전송 (디스크 읽기는 executor에서 수행)
+    반환: 요청한 길이를 모두 보냈는지 여부 (짧게 읽히면 False)
+    """
+    loop = asyncio.get_running_loop()
+    f.seek(start)
+    remaining = length
+    while remaining > 0:
+        chunk = await loop.run_in_executor(None, f.read, min(SERVE_CHUNK_SIZE, remaining))
+        if not chunk:
+            return False
+        writer.write(chunk)
+        await writer.drain()
+        remaining -= len(chunk)
+    return True
+
+async def handle_request(writer, method, target, headers, output_file, lib_paths, firmware_path):
+    """
+    단일 요청 처리
+    반환: 연결을 계속 사용할 수 있는지 여부
+    """
+    path = unquote(urlsplit(target).path)
+    head_only = method == "HEAD"
+    
+    if method not in ("GET", "HEAD"):
+        await send_response(writer, 405, {"Allow": "GET, HEAD", "Content-Length": "0"})
+        return False
+    
+    # 파일 검색/해시 계산은 디스크 작업이므로 executor에서 수행 (다른 연결이 멈추지 않도록)
+    loop = asyncio.get_running_loop()
+    files = await loop.run_in_executor(None, collect_served_files, output_file, lib_paths, firmware_path)
+    
+    # 목록 응답
+    if path in ("/", "/index.json"):
+        body = await loop.run_in_executor(None, build_listing, files, lib_paths)
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        if etag_matches(headers.get("if-none-match", ""), etag):
+            await send_response(writer, 304, {"ETag": etag})
+            return True
+        await send_response(writer, 200, {
+            "Content-Type": "application/json; charset=utf-8",
+            "Content-Length": str(len(body)),
+            "ETag": etag,
+            "Cache-Control": "no-cache",
+        }, b"" if head_only else body)
+        return True
+    
+    # 파일은 한 번만 열고 ETag/크기/전송 모두 같은 핸들 사용 (전송 중 번들이 교체되어도 일관성 유지)
+    f = None
+    file_path = files.get(path)
+    if file_path is not None:
+        try:
+            f = await loop.run_in_executor(None, open, file_path, 'rb')
+        except FileNotFoundError:
+            pass
+    if f is None:
+        body = b"Not Found\n"
+        await send_response(writer, 404, {
+            "Content-Type": "text/plain",
+            "Content-Length": str(len(body)),
+        }, b"" if head_only else body)
+        return True
+    
+    with f:
+        return await send_file_response(writer, f, file_path, headers, head_only)
+
+async def send_file_response(writer, f, file_path, headers, head_only):
+    """
+    열린 파일에 대한 응답 전송 (ETag/Range 처리)
+    반환: 연결을 계속 사용할 수 있는지 여부
+    """
+    loop = asyncio.get_running_loop()
+    etag, size = await loop.run_in_executor(None, file_etag, f, file_path)
+    common = {
+        "ETag": etag,
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "no-cache",
+    }
+    
+    if etag_matches(headers.get("if-none-match", ""), etag):
+        await send_response(writer, 304, common)
+        return True
+    
+    # Range 처리 (If-Range가 현재 ETag와 다르면 전체 전송)
+    byte_range = None
+    range_header = headers.get("range")
+    if range_header and headers.get("if-range", etag) == etag:
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            await send_response(writer, 416, {**common, "Content-Range": f"bytes */{size}", "Content-Length": "0"})
+            return True
+    
+    if byte_range:
+        start, end = byte_range
+        status = 206
+        common["Content-Range"] = f"bytes {start}-{end}/{size}"
+    else:
+        start, end = 0, size - 1
+        status = 200
+    length = end - start + 1
+    
+    await send_response(writer, status, {
+        **common,
+        "Content-Type": "application/octet-stream",
+        "Content-Length": str(length),
+    })
+    if head_only:
+        return True
+    return await send_file(writer, f, start, length)
+
+async def handle_client(reader, writer, output_file, lib_paths, firmware_path, debug=False):
+    """
+    클라이언트 연결 처리 (HTTP/1.1 keep-alive)
+    """
+    peer = writer.get_extra_info("peername")
+    try:
+        while True:
+            try:
+                request_line = await asyncio.wait_for(reader.readline(), SERVE_IDLE_TIMEOUT)
+            except asyncio.TimeoutError:
+                break
+            except ValueError:
+                # 요청줄이 스트림 버퍼 한도(64 KiB)를 넘는 경우
+                await send_response(writer, 400, {"Content-Length": "0", "Connection": "close"})
+                break
+            if not request_line:
+                break
+            
+            parts = request_line.decode('latin-1').split()
+            if len(parts) != 3:
+                await send_response(writer, 400, {"Content-Length": "0", "Connection": "close"})
+                break
+            method, target, version = parts
+            
+            # 헤더 읽기
+            headers = {}
+            try:
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode('latin-1').partition(":")
+                    headers[name.strip().lower()] = value.strip()
+            except ValueError:
+                # 헤더 줄이 스트림 버퍼 한도(64 KiB)를 넘는 경우
+                await send_response(writer, 400, {"Content-Length": "0", "Connection": "close"})
+                break
+            
+            if debug:
+                print(f"{peer} {method} {target} range={headers.get('range', '-')}")
+            
+            try:
+                reusable = await handle_request(writer, method, target, headers,
+                                                output_file, lib_paths, firmware_path)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                raise
+            except Exception as e:
+                print(f"{peer} error handling {method} {target}: {e!r}")
+                await send_response(writer, 500, {"Content-Length": "0", "Connection": "close"})
+                break
+            
+            keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+            if not keep_alive or not reusable:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError) as e:
+        if debug:
+            print(f"{peer} connection error: {e}")
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+async def serve(output_file, lib_paths, firmware_path, host, port, debug=False):
+    """
+    로컬 번들 서버 실행
+    """
+    handler = partial(handle_client, output_file=Path(output_file), lib_paths=[Path(p) for p in lib_paths],
+                      firmware_path=Path(firmware_path), debug=debug)
+    server = await asyncio.start_server(handler, host, port)
+    
+    addresses = ", ".join(str(sock.getsockname()) for sock in server.sockets)
+    print(f"Serving on {addresses}")
+    print("  Listing : /index.json")
+    print(f"  Bundle  : /{Path(output_file).name}")
+    print("  Library : /libs/<source>/<name>.zip")
+    
+    async with server:
+        await server.serve_forever()
+
+# ********************************************************************************
+# 번들 내용 비교 (diff)
+# ZIP 중앙 디렉토리의 CRC/크기만 읽어 비교하므로 압축 해제가 필요 없음
+# 결과 텍스트는 워크플로우의 번들 커밋 메시지 본문으로 사용됨
+# ********************************************************************************
+
+# 라이브러리별로 출력할 최대 파일 수
+DIFF_MAX_FILES = 20
+
+def normalize_zip_name(name):
+    """
+    extractall과 동일하게 ZIP 항목 경로 정리 (빈 경로/./.. 제거)
+    """
+    parts = [part for part in name.split("/") if part not in ("", ".", "..")]
+    return "/".join(parts)
+
+def is_bundle_excluded(rel_path):
+    """
+    process_libraries 최종 정리 단계에서 제거되는 항목인지 확인
+    """
+    parts = rel_path.split("/")
+    return parts[-1] in BUNDLE_META_FILES or any("00_created_" in part for part in parts[:-1])
+
+def bundle_entries(bundle_file):
+    """
+    번들 ZIP의 libraries/ 항목 -> (CRC, 크기)
+    """
+    entries = {}
+    with zipfile.ZipFile(bundle_file, 'r') as zipf:
+        for info in zipf.infolist():
+            if info.is_dir() or not info.filename.startswith("libraries/"):
+                continue
+            entries[info.filename[len("libraries/"):]] = (info.CRC, info.file_size)
+    return entries
+
+def library_zip_entries(zip_file):
+    """
+    라이브러리 ZIP이 번들에 들어갈 경로 -> (CRC, 크기), process_library의 추출 규칙과 동일
+    """
+    zip_name = Path(zip_file).stem
+    prefix = zip_name + "/"
+    with zipfile.ZipFile(zip_file, 'r') as zipf:
+        infos = [(normalize_zip_name(info.filename), info) for info in zipf.infolist()]
+    
+    # 라이브러리와 동일한 이름의 폴더가 있으면 그 안의 내용만 사용
+    matching_folder = any(name.startswith(prefix) for name, _ in infos)
+    
+    entries = {}
+    for name, info in infos:
+        if info.is_dir() or not name:
+            continue
+        if matching_folder:
+            if not name.startswith(prefix):
+                continue
+            rel = name[len(prefix):]
+        else:
+            # 최상위 날짜 폴더 제외
+            parts = name.split("/")
+            if len(parts) > 1 and "00_created_" in parts[0]:
+                continue
+            rel = name
+        entries[f"{zip_name}/{rel}"] = (info.CRC, info.file_size)
+    return entries
+
+def file_crc32(file_path):
+    """
+    파일 CRC-32 계산 (ZIP 헤더와 동일한 값)
+    """
+    crc = 0
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+def source_entries(lib_paths):
+    """
+    현재 소스 폴더로 번들을 만들었을 때의 항목 -> (CRC, 크기)
+    라이브러리 ZIP은 중앙 디렉토리만 읽고, ZIP이 없는 라이브러리만 파일 CRC를 계산
+    """
+    entries = {}
+    for src_base_dir in lib_paths:
+        for lib_dir in sorted(d for d in Path(src_base_dir).iterdir() if d.is_dir()):
+            if any(pattern in lib_dir.name for pattern in LIBRARY_EXCLUDE_PATTERNS):
+                continue
+            
+            zip_files = list(lib_dir.rglob("*.zip"))
+            if zip_files:
+                for zip_file in zip_files:
+                    entries.update(library_zip_entries(zip_file))
+                continue
+            
+            # ZIP 파일이 없는 경우 직접 복사되는 파일
+            for item in sorted(lib_dir.rglob("*")):
+                if not item.is_file():
+                    continue
+                rel = item.relative_to(lib_dir)
+                top = rel.parts[0]
+                if any(pattern in top for pattern in LIBRARY_EXCLUDE_PATTERNS):
+                    continue
+                if len(rel.parts) > 1 and "00_created_" in top:
+                    continue
+                entries[f"{lib_dir.name}/{rel.as_posix()}"] = (file_crc32(item), item.stat().st_size)
+    
+    return {rel: value for rel, value in entries.items() if not is_bundle_excluded(rel)}
+
+def diff_entries(old_entries, new_entries):
+    """
+    두 항목 목록을 라이브러리 단위로 비교
+    """
+    def group(entries):
+        libs = {}
+        for rel, value in entries.items():
+            lib_name, _, file_path = rel.partition("/")
+            libs.setdefault(lib_name, {})[file_path] = value
+        return libs
+    
+    old_libs = group(old_entries)
+    new_libs = group(new_entries)
+    result = {"added": [], "removed": [], "changed": []}
+    
+    for lib_name in sorted(new_libs.keys() - old_libs.keys()):
+        files = new_libs[lib_name]
+        result["added"].append({
+            "name": lib_name,
+            "files": len(files),
+            "size": sum(size for _, size in files.values()),
+        })
+    
+    for lib_name in sorted(old_libs.keys() - new_libs.keys()):
+        files = old_libs[lib_name]
+        result["removed"].append({
+            "name": lib_name,
+            "files": len(files),
+            "size": sum(size for _, size in files.values()),
+        })
+    
+    for lib_name in sorted(old_libs.keys() & new_libs.keys()):
+        old_files = old_libs[lib_name]
+        new_files = new_libs[lib_name]
+        if old_files == new_files:
+            continue
+        
+        files = []
+        for file_path in sorted(old_files.keys() | new_files.keys()):
+            old_size = old_files[file_path][1] if file_path in old_files else None
+            new_size = new_files[file_path][1] if file_path in new_files else None
+            if old_size is None:
+                status = "added"
+            elif new_size is None:
+                status = "removed"
+            elif old_files[file_path] != new_files[file_path]:
+                status = "changed"
+            else:
+                continue
+            files.append({
+                "path": file_path,
+                "status": status,
+                "size_delta": (new_size or 0) - (old_size or 0),
+            })
+        
+        result["changed"].append({
+            "name": lib_name,
+            "size_delta": sum(f["size_delta"] for f in files),
+            "files": files,
+        })
+    
+    return result
+
+def format_size(size, signed=False):
+    """
+    바이트 수를 읽기 쉬운 문자열로 변환
+    """
+    sign = ("+" if size >= 0 else "-") if signed else ""
+    value = abs(size)
+    for unit in ("B", "KB", "MB"):
+        if value < 1024 or unit == "MB":
+            return f"{sign}{value} {unit}" if unit == "B" else f"{sign}{value:.1f} {unit}"
+        value /= 1024
+
+def format_diff(result, max_files=DIFF_MAX_FILES):
+    """
+    비교 결과를 커밋 메시지 본문용 텍스트로 변환
+    """
+    if not any(result.values()):
+        return "No library changes."
+    
+    status_marks = {"added": "+", "removed": "-", "changed": "~"}
+    lines = [
+        f"Libraries: {len(result['added'])} added, {len(result['removed'])} removed, "
+        f"{len(result['changed'])} changed"
+    ]
+    
+    for lib in result["added"]:
+        lines.append(f"+ {lib['name']} ({lib['files']} files, {format_size(lib['size'])})")
+    for lib in result["removed"]:
+        lines.append(f"- {lib['name']} ({lib['files']} files, {format_size(lib['size'])})")
+    for lib in result["changed"]:
+        counts = {status: sum(1 for f in lib["files"] if f["status"] == status) for status in status_marks}
+        lines.append(
+            f"~ {lib['name']} ({counts['added']} added, {counts['removed']} removed, "
+            f"{counts['changed']} changed, {format_size(lib['size_delta'], signed=True)})"
+        )
+        for f in lib["files"][:max_files]:
+            lines.append(f"    {status_marks[f['status']]} {f['path']} ({format_size(f['size_delta'], signed=True)})")
+        if len(lib["files"]) > max_files:
+            lines.append(f"    ... and {len(lib['files']) - max_files} more files")
+    
+    return "\n".join(lines)
+
 def main():
     """
     메인 실행 함수
@@ -241,7 +1007,7 @@ def main():
     import argparse
     
     parser = argparse.ArgumentParser(description='ETboard Arduino Library Bundle Utility')
-    parser.add_argument('command', choices=['process-libraries', 'create-bundle', 'full-process'],
+    parser.add_argument('command', choices=['process-libraries', 'create-bundle', 'full-process', 'serve', 'diff'],
                         help='Command to execute')
     parser.add_argument('--etboard-path', 
                         default=PROJECT_ROOT / 'resources/libs/arduino/etboard',
@@ -258,6 +1024,18 @@ def main():
     parser.add_argument('--output-dir', 
                         default=PROJECT_ROOT / 'resources/libs/arduino/all-zip',
                         help='Output directory for ZIP file')
+    parser.add_argument('--firmware-path', 
+                        default=PROJECT_ROOT / 'resources/firmware',
+                        help='Path to firmware images (serve)')
+    parser.add_argument('--host', default='0.0.0.0', help='Bind address (serve)')
+    parser.add_argument('--port', type=int, default=8000, help='Bind port (serve)')
+    parser.add_argument('--no-resume', action='store_true',
+                        help='Discard checkpoint and intermediates before full-process')
+    parser.add_argument('--old', help='Previous bundle ZIP (diff)')
+    parser.add_argument('--new',
+                        help='New bundle ZIP (diff, default: current source roots)')
+    parser.add_argument('--format', choices=['text', 'json'], default='text',
+                        help='Output format (diff)')
     parser.add_argument('--debug', action='store_true', help='Enable debug output')
     
     args = parser.parse_args()
@@ -294,10 +1072,22 @@ def main():
         create_bundle(args.bundle_dir, output_file, None, None, args.debug)
     
     elif args.command == 'full-process':
+        # 체크포인트는 추출 폴더에 저장 (번들에 포함되지 않음)
+        checkpoint_file = Path(args.extract_dir) / CHECKPOINT_FILE
+        if args.no_resume:
+            cleanup(args.bundle_dir, args.extract_dir, args.debug)
+        elif checkpoint_file.exists():
+            print(f"Resuming from checkpoint: {checkpoint_file}")
+        
+        completed = False
         try:
             # 1. 라이브러리 처리
-            process_libraries(args.etboard_path, args.bundle_dir, args.extract_dir, args.debug)
-            process_libraries(args.original_path, args.bundle_dir, args.extract_dir, args.debug)
+            failed = process_libraries(args.etboard_path, args.bundle_dir, args.extract_dir,
+                                       args.debug, checkpoint_file)
+            failed += process_libraries(args.original_path, args.bundle_dir, args.extract_dir,
+                                        args.debug, checkpoint_file)
+            if failed:
+                raise RuntimeError(f"Failed to process libraries: {', '.join(failed)}")
             
             # 2. 번들 생성
             output_dir = Path(args.output_dir)
@@ -307,10 +1097,41 @@ def main():
             create_bundle(args.bundle_dir, output_file, None, None, args.debug)
             
             print(f"\nBundle created successfully: {output_file}")
+            completed = True
             
         finally:
-            # 3. 정리
-            cleanup(args.bundle_dir, args.extract_dir, args.debug)
+            # 3. 정리 (실패 시 중간 결과는 확인/재개를 위해 보존)
+            if completed:
+                cleanup(args.bundle_dir, args.extract_dir, args.debug)
+            else:
+                print("\nFull process did not complete; intermediate files kept for inspection:")
+                print(f"  {args.bundle_dir}")
+                print(f"  {args.extract_dir}")
+                print("Run full-process again to resume, or add --no-resume to start over.")
+    
+    elif args.command == 'serve':
+        output_file = Path(args.output_dir) / filename
+        try:
+            asyncio.run(serve(output_file, [args.etboard_path, args.original_path],
+                              args.firmware_path, args.host, args.port, args.debug))
+        except KeyboardInterrupt:
+            print("\nServer stopped")
+    
+    elif args.command == 'diff':
+        if not args.old:
+            parser.error("diff requires --old")
+        
+        old_entries = bundle_entries(args.old)
+        if args.new:
+            new_entries = bundle_entries(args.new)
+        else:
+            new_entries = source_entries([args.etboard_path, args.original_path])
+        
+        result = diff_entries(old_entries, new_entries)
+        if args.format == 'json':
+            print(json.dumps(result, ensure_ascii=False, indent=2))
+        else:
+            print(format_diff(result))
 
 if __name__ == "__main__":
     main()